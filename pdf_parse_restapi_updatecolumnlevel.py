@@ -1,45 +1,169 @@
-from glob import glob
-import tabula
-import pandas as pd
 import os
-from tabulate import tabulate
-from PyPDF2 import PdfReader
+import mmap
 import re
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pypdfium2 as pdfium  # Faster native text extraction; PyPDF2 is used when it is missing
+except ImportError:
+    pdfium = None
+
+try:
+    import orjson  # Serializes the metadata JSON in C; json is used when it is missing
+except ImportError:
+    orjson = None
+
+# latin-1 decodes any byte sequence, so nothing after it would ever be tried
+ENCODINGS_TO_TRY = ['utf-8', 'latin-1']
+# Larger JVM heap for tabula so big PDFs don't spend their time in GC
+TABULA_JAVA_OPTIONS = ['-Xmx4g']
+
+# Cell sentinels: 'nan' is an empty cell, 'Unnamed: 3' the placeholder header of the description column
+_NAN = 'nan'
+_UNNAMED3 = 'Unnamed: 3'
+
+# Precompiled patterns used in the per-line / per-file loops below
+_TABLE_NAME_RE = re.compile(r"Table Name[::]?\s*(\S+)")        # "Table Name: XXX" in PDF text
+_MD_TABLE_NAME_RE = re.compile(r"Table Name\s*\|\s*(\S+)")     # "Table Name | XXX" in decoded markdown
+# Whole markdown separator lines (with their newline), so a file can be filtered with one sub() call:
+#   1. Traditional markdown separators like ---|:--|---
+#   2. JSON-style separators like ":-----": ":----..."
+#   3. Lines with only colons, dashes, quotes and pipes
+# [^\S\n] is whitespace other than the newline, so no alternative can run into the next line
+_SEP_ANY_MULTILINE = re.compile(
+    r'(?m)^(?:[^\S\n]*\|(?:[^\S\n]|[\-\:])+\|[^\S\n]*'
+    r'|[^\S\n]*"?:[^\|\n]*"?[^\S\n]*:[^\S\n]*"?:[^\|\n]*"?[^\S\n]*,?[^\S\n]*'
+    r'|(?:[^\S\n]|[\|\"\:\-\,])*)(?:\n|\Z)'
+)
+_TABLE_FILE_RE = re.compile(r'table_(\d+)\.md')
+
+# Table attribute rows: column-2 label -> metadata key that takes the column-3 value
+_TABLE_ATTRIBUTE_LABELS = {
+    'Table Synonym': 'Table Synonym',
+    'Table Comments': 'Table Description',
+    'Module Name': 'Module Name',
+}
+# Column-2 labels in the order they are tested as substrings ('Key Field Name' contains 'Field Name')
+_ROW_LABELS = ('Table Name', *_TABLE_ATTRIBUTE_LABELS, 'Key Field Name', 'Field Name')
+_ROW_LABEL_SET = frozenset(_ROW_LABELS)
+
+def _pdfium_page_texts(pdf_path):
+    """
+    Yields the text of each page of a PDF, extracted with pypdfium2.
+    Page and text-page handles are closed as soon as each page has been read.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+def _pypdf2_page_texts(pdf_path):
+    """
+    Yields the text of each page of a PDF, extracted with PyPDF2.
+    """
+    from PyPDF2 import PdfReader
 
-pd.set_option('display.max_columns', None)  # Show all columns
-pd.set_option('display.max_rows', None)     # Show all rows (be careful with large data)
-pd.set_option('display.width', None)            # No line wrapping
-pd.set_option('display.max_colwidth', None)     # Show full content in each cell
+    reader = PdfReader(pdf_path)
+    for page in reader.pages:
+        yield page.extract_text() or ""
 
-ENCODINGS_TO_TRY = ['utf-8', 'latin-1', 'cp1252']
-def count_table_name_occurrences_in_pdf(pdf_path):
+def _scan_pdf_table_names(page_texts):
+    """
+    Returns the values following "Table Name" in the given page texts, scanning page by page.
+    """
     table_names = []
-    try:
-        # Use PyPDF2 to read the PDF text
-        reader = PdfReader(pdf_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text()
-   
+    for page_text in page_texts:
         # Count occurrences of "Table Name"
-        
-        lines = text.splitlines()  
-        for line in lines:
+        for line in page_text.splitlines():
             if "Table Name" in line:
-                match = re.search(r"Table Name[::]?\s*(\S+)", line)
+                match = _TABLE_NAME_RE.search(line)
                 if match:
-                        table_names.append(match.group(1)) 
-        print(f"Found {len(table_names)} 'Table Name' entries in the PDF.")                
+                    table_names.append(match.group(1))
+    return table_names
+
+def count_table_name_occurrences_in_pdf(pdf_path):
+    try:
+        table_names = None
+        # Prefer pypdfium2; fall back to PyPDF2 if it is not installed or cannot read this PDF
+        if pdfium is not None:
+            try:
+                table_names = _scan_pdf_table_names(_pdfium_page_texts(pdf_path))
+            except Exception as pdfium_error:
+                print(f"pypdfium2 could not read {pdf_path} ({pdfium_error}), falling back to PyPDF2.")
+        if table_names is None:
+            table_names = _scan_pdf_table_names(_pypdf2_page_texts(pdf_path))
+        print(f"Found {len(table_names)} 'Table Name' entries in the PDF.")
         return table_names
     except Exception as e:
         return []
 
+def _tabula_header(cells):
+    """
+    Names header cells the way tabula-py names DataFrame columns: empty cells become 'Unnamed: 0',
+    'Unnamed: 1', ... counted over the empty cells only, then repeated names get '.1', '.2', ... suffixes.
+    """
+    header = []
+    unnamed_idx = 0
+    for cell in cells:
+        if cell:
+            header.append(cell)
+        else:
+            header.append(f'Unnamed: {unnamed_idx}')
+            unnamed_idx += 1
+
+    # Avoid duplicate column names by adding '.N' as a suffix
+    counts = {}
+    for k, name in enumerate(header):
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f'{name}.{count}'
+            count = counts.get(name, 0)
+        header[k] = name
+        counts[name] = count + 1
+    return header
+
+def _pipe_lines(row):
+    """
+    Formats one row of string cells as pipe-delimited Markdown lines. A cell with embedded line
+    breaks is spread over several lines, the other cells padded with '', as tabulate did; the
+    markdown parser relies on these extra lines as continuation rows.
+    """
+    if not any('\n' in cell or '\r' in cell for cell in row):
+        return ['| ' + ' | '.join(row) + ' |']
+    cell_lines = [cell.splitlines() or [''] for cell in row]
+    height = max(len(lines) for lines in cell_lines)
+    return ['| ' + ' | '.join(lines[k] if k < len(lines) else '' for lines in cell_lines) + ' |'
+            for k in range(height)]
+
+def _rows_to_pipe_markdown(header, rows):
+    """
+    Formats a header and data rows of string cells as a pipe-delimited Markdown table.
+    Cells are written without column padding, since the files are only re-parsed by splitting on pipes.
+    """
+    lines = _pipe_lines(header)
+    lines.append('|' + '|'.join(['---'] * len(header)) + '|')
+    for row in rows:
+        lines.extend(_pipe_lines(row))
+    return '\n'.join(lines)
+
 def pdf_to_markdown(pdf_path, output_dir):
     """
     Reads tables from a PDF using tabula with different modes and saves each table as a Markdown file.
-    Prints diagnostic counts.
+    Tables are taken as tabula's raw JSON rows rather than DataFrames. Prints diagnostic counts.
     """
+    # Imported here rather than at module level: tabula pulls in pandas, and the process-pool workers
+    # that re-import this module (spawn start method, e.g. on Windows) only read markdown files
+    import tabula
+
     print(f"Reading tables from {pdf_path} using tabula...")
     detected_tables = []
 
@@ -51,8 +175,12 @@ def pdf_to_markdown(pdf_path, output_dir):
            multiple_tables=True,
            guess=True, # Still let tabula guess
            lattice=True, # Use lattice mode
-           area=[30, 0, 842, 595] # Skip top 30 points to avoid watermark
+           area=[30, 0, 842, 595], # Skip top 30 points to avoid watermark
+           output_format='json', # Raw cell text, no DataFrame per table
+           java_options=TABULA_JAVA_OPTIONS
        )
+       # tabula-py drops tables without any rows before building DataFrames, so they get no table number
+       detected_tables = [table for table in detected_tables if not isinstance(table, dict) or table.get("data")]
        tabula_mode_used = "lattice"
        print(f"Tabula (lattice mode) detected {len(detected_tables)} potential tables.")
     except Exception as tabula_lattice_error:
@@ -71,35 +199,98 @@ def pdf_to_markdown(pdf_path, output_dir):
     skipped_count = 0
     for i, table in enumerate(detected_tables):
         markdown_file = os.path.join(output_dir, f'table_{i+1}.md')
-
-        # Check if tabula returned a valid, non-empty DataFrame
-        if not isinstance(table, pd.DataFrame) or table.empty:
-             # print(f"Skipping table {i+1}: Not a DataFrame or is empty.")
+        temp_file = markdown_file + '.tmp'
+
+        # Each JSON table is a dict whose "data" is a list of rows of {"text": ...} cells
+        # Missing text becomes '' here, once, so the rows hold only strings
+        # Cell text is written as tabula-java read it: unlike tabula-py's DataFrames (pd.to_numeric per
+        # column, then tabulate's number formatting) numeric-looking cells are not reformatted, so '007'
+        # stays '007' instead of becoming '7'
+        rows = [[cell["text"] or '' for cell in row] for row in table.get("data", [])] if isinstance(table, dict) else []
+
+        # Check if tabula returned a valid, non-empty table (first row is the header, as in tabula's DataFrames)
+        if len(rows) < 2 or not rows[0]:
+             # print(f"Skipping table {i+1}: Not a table or is empty.")
              skipped_count += 1
-             continue # Skip if not a DataFrame or is empty
+             continue # Skip if not a table or is empty
 
         try:
-            # Using tabulate to format the DataFrame into Markdown
-            # showindex=False prevents pandas index from being written to MD
-            # headers='keys' uses DataFrame column names
-            markdown_output = tabulate(table, headers='keys', tablefmt='pipe', showindex=False)
+            # Format the rows into Markdown, first row as the header named as in tabula's DataFrames
+            markdown_output = _rows_to_pipe_markdown(_tabula_header(rows[0]), rows[1:])
             # Use utf-8 encoding when writing, as it's standard and avoids issues like 0x96
-            with open(markdown_file, 'w', encoding='utf-8') as f:
-                f.write(markdown_output)
-            # f.write("\n\n") # Optional: add newline after each table
+            # Encode once and write the bytes to a temp file, then rename it into place so a crash
+            # never leaves a partial table file behind
+            with open(temp_file, 'wb', buffering=1 << 16) as f:
+                f.write(markdown_output.encode('utf-8'))
+            # f.write(b"\n\n") # Optional: add newline after each table
+            os.replace(temp_file, markdown_file)
             saved_count += 1
-        except Exception as tabulate_error:
-            print(f"Error formatting or writing table {i+1} to Markdown ({markdown_file}): {tabulate_error}")
+        except Exception as format_error:
+            print(f"Error formatting or writing table {i+1} to Markdown ({markdown_file}): {format_error}")
             skipped_count += 1
+            # Don't leave a partial temp file behind
+            if os.path.exists(temp_file):
+                try:
+                    os.remove(temp_file)
+                except OSError as cleanup_error:
+                    print(f"Could not remove temporary file {temp_file}: {cleanup_error}")
 
 
     print(f"--- Tabula Processing Summary ({tabula_mode_used} mode) ---")
     print(f"Tables detected by tabula: {len(detected_tables)}")
     print(f"Tables successfully saved as Markdown files: {saved_count}")
-    print(f"Tables skipped (not DataFrame or empty, or write error): {skipped_count}")
+    print(f"Tables skipped (not a table or empty, or write error): {skipped_count}")
     print("-" * 30)
 
 
+def _list_markdown_files(folder):
+    """
+    Returns the paths of the (non-hidden) .md files directly inside a folder, unsorted.
+    Returns an empty list if the folder does not exist.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.endswith('.md') and not entry.name.startswith('.') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+def _scan_markdown_table_names(file):
+    """
+    Returns the values found after "Table Name |" in one markdown file, or None if the file could not be read.
+    The file is checked for "Table Name" through a read-only memory map first; only files that contain it are
+    decoded, with encoding fallback, and searched. Runs in a worker process.
+    """
+    raw_content = None
+    try:
+        with open(file, 'rb') as md_file:
+            if os.fstat(md_file.fileno()).st_size == 0:
+                return [] # An empty file cannot be mapped, and has no names anyway
+            with mmap.mmap(md_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                if mapped_file.find(b"Table Name") == -1:
+                    return [] # Most table files have no names, so skip reading and decoding them
+                raw_content = mapped_file[:]
+    except FileNotFoundError:
+        print(f"Error: File not found: {file}")
+        return None
+    except Exception as e:
+        print(f"An unexpected error occurred reading file {file}: {e}")
+        return None
+
+    file_content = None # To hold the content after successful decoding
+    for encoding in ENCODINGS_TO_TRY:
+        try:
+            file_content = raw_content.decode(encoding)
+            break # Exit encoding loop for this file
+        except UnicodeDecodeError:
+            continue # Try the next encoding
+
+    if file_content is None:
+        return None
+    # Look for "Table Name" followed by optional space, pipe, optional space, and then the name
+    # Matched on the decoded text so that \s and \S also treat Unicode whitespace (e.g. NBSP) as whitespace
+    return _MD_TABLE_NAME_RE.findall(file_content)
+
 # Function to count and extract "Table Name" from Markdown files using encoding fallback
 def extract_table_names_in_markdown(folder):
     """
@@ -111,120 +302,105 @@ def extract_table_names_in_markdown(folder):
     total_count = 0
 
     # Find all markdown files in the folder
-    files = sorted(glob(f"{folder}/*.md"))
+    files = sorted(_list_markdown_files(folder))
     print(f"Found {len(files)} markdown files.")
 
     if not files:
         print(f"No markdown files found in '{folder}'.")
         return [] # Return empty list if no files found
 
-    # Look for "Table Name" followed by optional space, pipe, optional space, and then the name
-    markdown_pattern = r"Table Name\s*\|\s*(\S+)"
-    
-    for file in files:
-
-        file_content = None # To hold the content after successful decoding
-
-        # Try different encodings to read the file
-        for encoding in ENCODINGS_TO_TRY:
-            try:
-                with open(file, 'r', encoding=encoding) as md_file:
-
-                    file_content = md_file.read() # Read the whole file content
-                # If reading was successful, break out of the encoding loop
-                # print(f"Successfully read file '{os.path.basename(file)}' with encoding '{encoding}'.")
-                break # Exit encoding loop for this file
-            except UnicodeDecodeError:
-                # print(f"Failed to decode '{os.path.basename(file)}' with encoding '{encoding}'. Trying next...")
-                continue # Try the next encoding
-            except FileNotFoundError:
-                 print(f"Error: File not found during encoding test: {file}")
-                 file_content = None # Ensure file_content is None to indicate failure
-                 break # File not found, no need to try more encodings
-            except Exception as e:
-                 print(f"An unexpected error occurred reading file {file} with encoding {encoding}: {e}")
-                 file_content = None # Ensure file_content is None
-                 break # Stop trying encodings for this file
-
-
-        # After trying encodings, process the content using regex if successfully read
-        if file_content is not None:
-            matches = re.findall(markdown_pattern, file_content)
-            # For debugging, print which files contain "Table Name" and how many times
-            # if matches:
-            #    print(f"  Found {len(matches)} 'Table Name' in {os.path.basename(file)}")
-            table_names.extend(matches) # Add found names to the main list
-            total_count += len(matches)
-             
-
-        else:
-            print(f"Warning: Could not read file '{os.path.basename(file)}' with any of the attempted encodings. Skipping scan for Table Names in this file.")
-            # File not read, cannot count names from it
+    # Files are independent, so scan them in worker processes; map() keeps the results in file order
+    with ProcessPoolExecutor() as executor:
+        for file, matches in zip(files, executor.map(_scan_markdown_table_names, files, chunksize=8)):
+            if matches is not None:
+                # For debugging, print which files contain "Table Name" and how many times
+                # if matches:
+                #    print(f"  Found {len(matches)} 'Table Name' in {os.path.basename(file)}")
+                table_names.extend(matches) # Add found names to the main list
+                total_count += len(matches)
+            else:
+                print(f"Warning: Could not read file '{os.path.basename(file)}' with any of the attempted encodings. Skipping scan for Table Names in this file.")
+                # File not read, cannot count names from it
 
     # print(f"Finished scanning markdown files. Found {total_count} 'Table Name' entries across all files.")
     # The return value is the list, its length is the total count
     return table_names 
 
-def extract_table_details_from_markdown(output_dir, output_json_path=None):
-    files = sorted(glob(f"{output_dir}/*.md"), key=lambda x: int(re.search(r'table_(\d+)\.md', x).group(1)) if re.search(r'table_(\d+)\.md', x) else 0)
-    results = []
-    if not files:
-        print(f"No markdown files found in '{output_dir}'.")
-        return []
+def _read_markdown_columns(file):
+    """
+    Reads one markdown table file and returns (columns, error): columns 1-5 as lists of stripped
+    cell strings, or None and the error message if the file could not be read. Runs in a worker process.
+    """
+    try:
+        # Read and filter out markdown separator lines before parsing
+        with open(file, 'r', encoding='utf-8') as f:
+            file_content = f.read()
+
+        # Remove lines that are markdown table separators (contain pattern like ---|:--|--- or ":---":")
+        # in one pass; blank lines go too, so only a trailing '' can be empty after the split
+        filtered_lines = [line for line in _SEP_ANY_MULTILINE.sub('', file_content).split('\n') if line]
+
+        # Split the filtered lines on pipes directly, the same way the table used to be read
+        # with pandas (no header row): the first row fixes the column count, wider rows are
+        # skipped, shorter rows are padded, and empty cells read as 'nan'
+        rows = []
+        n_cols = None
+        for line in filtered_lines:
+            cells = [cell.strip() or _NAN for cell in line.split('|')]
+            if n_cols is None:
+                n_cols = len(cells)
+            elif len(cells) > n_cols:
+                continue
+            elif len(cells) < n_cols:
+                cells.extend([_NAN] * (n_cols - len(cells)))
+            rows.append(cells)
+
+        # Transpose once (rows are all n_cols wide), then take columns 1-5 as plain lists;
+        # columns missing from this table read as ''
+        table_columns = list(zip(*rows))
+        columns = [
+            list(table_columns[i]) if i < len(table_columns) else [''] * len(rows)
+            for i in range(1, 6)
+        ]
+        return columns, None
+    except Exception as e:
+        return None, str(e)
+
+def _classify_markdown_rows(parsed_files):
+    """
+    Builds the table metadata from (file, (columns, error)) pairs, in file order.
+    A table and its field sections carry over from one file to the next, so all files go through
+    this one loop. Field descriptions are left as lists of lines.
+    """
     in_key_field_section = False
     in_field_section = False
     table_name = None
+    current_table = None  # metadata[table_name]; its "Key Fields"/"Normal Fields" dicts are key_field_obj/field_info
     metadata = {}
 
-    for file in files:
+    for file, (columns, read_error) in parsed_files:
+        if read_error is not None:
+            print(f"Error processing file {file}: {read_error}")
+            continue
         try:
-            # Read and filter out markdown separator lines before parsing
-            with open(file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Filter out lines that contain markdown table separators (lines with dashes and colons)
-            filtered_lines = []
-            for line in lines:
-                # Skip lines that are markdown table separators (contain pattern like ---|:--|--- or ":---":")
-                line_stripped = line.strip()
-                # Pattern 1: Traditional markdown separators like ---|:--|---
-                pattern1 = re.match(r'^\s*\|[\s\-\:]+\|\s*$', line_stripped)
-                # Pattern 2: JSON-style separators like ":-----": ":----..."
-                pattern2 = re.match(r'^\s*"?:[^\|]*"?\s*:\s*"?:[^\|]*"?\s*,?\s*$', line_stripped)
-                # Pattern 3: Lines with only colons, dashes, quotes and pipes
-                pattern3 = re.match(r'^[\s\|\"\:\-\,]*$', line_stripped)
-                
-                if not (pattern1 or pattern2 or pattern3):
-                    filtered_lines.append(line)
-            
-            # Use StringIO to create an in-memory file for pandas to read
-            from io import StringIO
-            filtered_content = ''.join(filtered_lines)
-            
-            # Read the filtered content with pandas without treating first row as header
-            df = pd.read_csv(StringIO(filtered_content), sep='|', skipinitialspace=True, engine='python', header=None, encoding='utf-8', on_bad_lines='skip')
-
-            # Rename columns by index, not by name
-            df.columns = [f'column_{i}' for i in range(df.shape[1])]
-            
-
+            c1, c2, c3, c4, c5 = columns
+            n_rows = len(c2)
+
+            # col1: entry indicator, col2: 'Table Name' and field name, col3: table name and data type,
+            # col4: description, col5: foreign key or other info
+            for idx, (col1, col2, col3, col4, col5) in enumerate(zip(c1, c2, c3, c4, c5)):
+                # Find the row's label: an exact label is one set lookup, and since every label
+                # contains a space, cells without one (field names, 'nan') skip the substring scan
+                if col2 in _ROW_LABEL_SET:
+                    label = col2
+                elif ' ' in col2:
+                    label = next((row_label for row_label in _ROW_LABELS if row_label in col2), None)
+                else:
+                    label = None
 
-            prev_row = None
-            for idx, row in df.iterrows():
-                # Safely get column values with proper error handling
-                try:
-                    col1 = str(row.get('column_1', '') if 'column_1' in df.columns else '').strip()    # entry indicator
-                    col2 = str(row.get('column_2', '') if 'column_2' in df.columns else '').strip()    # 'Table Name' and field name 
-                    col3 = str(row.get('column_3', '') if 'column_3' in df.columns else '').strip()    # Table name and data type 
-                    col4 = str(row.get('column_4', '') if 'column_4' in df.columns else '').strip()    # description
-                    col5 = str(row.get('column_5', '') if 'column_5' in df.columns else '').strip()    # foreign key or other info
-                except Exception as row_error:
-                    print(f"Error processing row {idx} in {file}: {row_error}")
-                    continue
                 # Detect table name
-                if 'Table Name' in col2:
+                if label == 'Table Name':
                     table_name = col3
-                    results.append(table_name)  
                     in_field_section = False
                     in_key_field_section = False
                     key_field_obj = {}
@@ -232,7 +408,7 @@ def extract_table_details_from_markdown(output_dir, output_json_path=None):
                     table_synonym=None
                     table_description=None
                     module_name=None
-                    metadata[table_name] =    {
+                    metadata[table_name] = current_table = {
                         "Table Name": table_name,
                         "Table Synonym": table_synonym,
                         "Table Description": table_description,
@@ -242,36 +418,24 @@ def extract_table_details_from_markdown(output_dir, output_json_path=None):
                     if col3 == 'B_PG_PICBX4008_TDA_ACCRUAL':
                         print(f"Processing table: {table_name} in file {file}")
 
-                    
                 
-                # update table synonym 
-                elif 'Table Synonym' in col2 :
-                    table_synonym = col3    
-                    if metadata[table_name]:
-                        metadata[table_name]["Table Synonym"] = table_synonym                 
-
-                # update table description 
-                elif 'Table Comments' in col2:
-                    table_description = col3 
-                    if metadata[table_name]:
-                        metadata[table_name]["Table Description"] = table_description                     
-                # update module name
-                elif 'Module Name' in col2 :
-                    module_name = col3 
-                    if metadata[table_name]:
-                        metadata[table_name]["Module Name"] = module_name                        
+            
+                # update table synonym, description or module name
+                elif label in _TABLE_ATTRIBUTE_LABELS:
+                    if current_table is not None:
+                        current_table[_TABLE_ATTRIBUTE_LABELS[label]] = col3
 
                 # Detect start of key field section
-                elif 'Key Field Name' in col2:
+                elif label == 'Key Field Name':
 
-          
+      
                     in_key_field_section = True
                     in_field_section = False
                     current_Key_Field_Fullname = None  # Initialize tracking variable
 
-                    
+                
                 # Detect start of normal field section
-                elif 'Field Name' in col2:
+                elif label == 'Field Name':
                     in_field_section = True
                     in_key_field_section = False
                     current_Normal_Field_Fullname = None  # Initialize tracking variable
@@ -279,54 +443,55 @@ def extract_table_details_from_markdown(output_dir, output_json_path=None):
                 # Detect blank row (section end) or if next row is "Field Name"
                 elif col2 is None and col3 is None and col4 is None:   
                     continue
-                    
+                
                 else:
                     # Only process fields if we have a valid table_name
                     if not table_name:
                         continue
-                        
+
+                    # Entry header row: col1 is empty (nan) and col2 holds a field name
+                    is_header_row = col1 == _NAN and col2 and col2 != _NAN
+                    
                     # Process Key Fields
                     if in_key_field_section:
                         field = col2
                         data_type = col3
                         desc = col4
                         foreign_key=col5
-                        if col1=='nan' and field and field!="nan" :  # Entry header indicator --col1 is nan                                                        
+                        if is_header_row:  # Entry header indicator --col1 is nan
                             # Check if field name is likely get truncated (length >= 19)
                             if len(field) >= 19:   
 
                                 # check if next row exists
-                                if idx + 1 < len(df):
-                                    next_row = df.iloc[idx + 1]
-                                    next_field_entry_indicator = str(next_row.get('column_1', '') if 'column_1' in df.columns else '').strip()
-                                    next_field_name_piece = str(next_row.get('column_2', '') if 'column_2' in df.columns else '').strip()                 
-                                    
+                                if idx + 1 < n_rows:
+                                    next_field_entry_indicator = c1[idx + 1]
+                                    next_field_name_piece = c2[idx + 1]
+                                
                                     # check if field name has continuation 
-                                    if next_field_entry_indicator!='nan' and next_field_name_piece !='nan':
+                                    if next_field_entry_indicator != _NAN and next_field_name_piece != _NAN:
                                         current_Key_Field_Fullname = field + next_field_name_piece  # Concatenate field name
 
-                                        metadata[table_name]["Key Fields"][current_Key_Field_Fullname] = {
+                                        key_field_obj[current_Key_Field_Fullname] = {
                                             "type": data_type ,
-                                            "description": desc ,
-                                            "foreign_key": foreign_key if foreign_key != 'nan' else ''
+                                            "description": [desc],
+                                            "foreign_key": foreign_key if foreign_key != _NAN else ''
                                         }
-                        
+                    
                             else:  
                                 current_Key_Field_Fullname = field                                
-                                metadata[table_name]["Key Fields"][current_Key_Field_Fullname] = {
+                                key_field_obj[current_Key_Field_Fullname] = {
                                             "type": data_type ,
-                                            "description": desc ,
-                                            "foreign_key": foreign_key if foreign_key != 'nan' else ''
+                                            "description": [desc],
+                                            "foreign_key": foreign_key if foreign_key != _NAN else ''
                                         }
-              
+          
                         else :
                             # This is a continuation line for the current key field
-                            if current_Key_Field_Fullname and desc !="nan" and desc !="Unnamed: 3" and desc:
+                            if current_Key_Field_Fullname and desc and desc != _NAN and desc != _UNNAMED3:
                                 # Append description to the last key field
-                                full_description = metadata[table_name]["Key Fields"][current_Key_Field_Fullname]["description"]+f" {desc}"
-                                metadata[table_name]["Key Fields"][current_Key_Field_Fullname]["description"] = full_description
-                                
+                                key_field_obj[current_Key_Field_Fullname]["description"].append(desc)
                             
+                        
                     # Process normal fields
                     elif in_field_section:
                         field = col2
@@ -335,32 +500,31 @@ def extract_table_details_from_markdown(output_dir, output_json_path=None):
                         foreign_key=col5 
  
                         # Check if col1 is 'nan' and field is not empty
-                        if col1=='nan' and field and field!="nan" :  # Entry header indicator --col1 is nan                                                        
+                        if is_header_row:  # Entry header indicator --col1 is nan
                             # Check if field name is likely get truncated (length >= 19)
                             if len(field) >= 19: 
-                            
+                        
                                 # check if next row exists
-                                if idx + 1 < len(df):
-                                    next_row = df.iloc[idx + 1]
-                                    next_field_entry_indicator = str(next_row.get('column_1', '') if 'column_1' in df.columns else '').strip()
-                                    next_field_name_piece = str(next_row.get('column_2', '') if 'column_2' in df.columns else '').strip()                 
-                                    
+                                if idx + 1 < n_rows:
+                                    next_field_entry_indicator = c1[idx + 1]
+                                    next_field_name_piece = c2[idx + 1]
+                                
                                     # check if field name has continuation 
-                                    if next_field_entry_indicator!='nan' and next_field_name_piece !='nan':
+                                    if next_field_entry_indicator != _NAN and next_field_name_piece != _NAN:
                                         current_Normal_Field_Fullname = field + next_field_name_piece  # Concatenate field name
-                                        metadata[table_name]["Normal Fields"][current_Normal_Field_Fullname] = {
+                                        field_info[current_Normal_Field_Fullname] = {
                                             "type": data_type ,
-                                            "description": desc ,
-                                            "foreign_key": foreign_key if foreign_key != 'nan' else ''
+                                            "description": [desc],
+                                            "foreign_key": foreign_key if foreign_key != _NAN else ''
                                         }
   
                             # field name not getting truncated                             
                             else:  
                                 current_Normal_Field_Fullname = field
-                                metadata[table_name]["Normal Fields"][current_Normal_Field_Fullname] = {
+                                field_info[current_Normal_Field_Fullname] = {
                                             "type": data_type ,
-                                            "description": desc  ,
-                                            "foreign_key": foreign_key if foreign_key != 'nan' else ''
+                                            "description": [desc],
+                                            "foreign_key": foreign_key if foreign_key != _NAN else ''
                                         }
                                 if table_name=="B_PG_PICBX4008_TDA_ACCRUAL":
                                     if field=="status":
@@ -370,26 +534,47 @@ def extract_table_details_from_markdown(output_dir, output_json_path=None):
 
                         else :
                             # This is a continuation line for the current normal field
-                            if current_Normal_Field_Fullname and desc !="nan" and desc !="Unnamed: 3" and desc:
+                            if current_Normal_Field_Fullname and desc and desc != _NAN and desc != _UNNAMED3:
                                 # Append description to the last normal field
-                                full_description = metadata[table_name]["Normal Fields"][current_Normal_Field_Fullname]["description"]+f" {desc}"
-                                metadata[table_name]["Normal Fields"][current_Normal_Field_Fullname]["description"] = full_description
-                             
-            
-            # At the end of each file processing, update the last metadata in results with all collected fields
-            if table_name and results:
-                # Get the last metadata from results list
-                last_metadata = results[-1]
-                
-
-                
-            
+                                field_info[current_Normal_Field_Fullname]["description"].append(desc)
+                         
+        
         except Exception as e:
             print(f"Error processing file {file}: {e}")
+
+    return metadata
+
+def extract_table_details_from_markdown(output_dir, output_json_path=None):
+    # Order by table number (table_N.md), matching each path once; files without a number sort first
+    numbered_files = [(int(match.group(1)) if (match := _TABLE_FILE_RE.search(file)) else 0, file)
+                      for file in _list_markdown_files(output_dir)]
+    numbered_files.sort()
+    files = [file for _, file in numbered_files]
+    if not files:
+        print(f"No markdown files found in '{output_dir}'.")
+        return []
+
+    # Reading and splitting the files is independent per file, so it runs in worker processes;
+    # the rows are classified in this process as the results arrive, in file order
+    with ProcessPoolExecutor() as executor:
+        parsed_files = executor.map(_read_markdown_columns, files, chunksize=8)
+        metadata = _classify_markdown_rows(zip(files, parsed_files))
+
+    # Descriptions are collected as lists of lines (they may continue into the next file); join them once here
+    for table in metadata.values():
+        for fields in (table["Key Fields"], table["Normal Fields"]):
+            for field_entry in fields.values():
+                field_entry["description"] = " ".join(field_entry["description"])
+
     # Write metadata to JSON file
     if output_json_path:
-        with open(output_json_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # orjson writes UTF-8 bytes directly (non-ASCII unescaped, like ensure_ascii=False)
+            with open(output_json_path, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_json_path, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=2)
     
     return metadata
 